@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    # Positions of the set bits of a Python-int bitset, lowest first.
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -4,9 +4,15 @@ import argparse
 import json
 from pathlib import Path
 
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ModuleNotFoundError:
+    HAVE_ORJSON = False
+
 from .extractor import extract_logic_atoms_from_text
-from .llm_extractor import RecursiveLLMExtractor, OpenAIProvider, GeminiProvider
-from .finlex import fetch_finlex_html, finlex_html_to_text
+from .llm_extractor import DEFAULT_CACHE_PATH, RecursiveLLMExtractor, OpenAIProvider, GeminiProvider
 from .models import LogicAtom
 from .recursive import resolve_rule_references
 from .symbolic import check_scenario, find_pairwise_conflicts, symbolic_backend_name
@@ -34,7 +40,10 @@ def _parse_scenario(items: list[str] | None) -> dict[str, bool]:
 
 
 def _load_atoms_from_json(path: Path) -> list[LogicAtom]:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    if HAVE_ORJSON:
+        raw = orjson.loads(path.read_bytes())
+    else:
+        raw = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(raw, list):
         raise ValueError("JSON must be a list of rule objects")
     return [LogicAtom.from_dict(item) for item in raw]
@@ -47,6 +56,8 @@ def _load_atoms_from_source(args: argparse.Namespace) -> list[LogicAtom]:
     if args.text_file:
         source_text = Path(args.text_file).read_text(encoding="utf-8")
     else:
+        from .finlex import fetch_finlex_html, finlex_html_to_text
+
         html = fetch_finlex_html(args.finlex_url)
         source_text = finlex_html_to_text(html)
 
@@ -64,7 +75,10 @@ def _load_atoms_from_source(args: argparse.Namespace) -> list[LogicAtom]:
                 os.environ["OPENAI_API_KEY"] = args.openai_key
             provider = OpenAIProvider()
             
-        extractor = RecursiveLLMExtractor(provider)
+        cache_path = None if args.no_llm_cache else args.llm_cache
+        extractor = RecursiveLLMExtractor(
+            provider, batch_size=args.llm_batch_size, cache_path=cache_path
+        )
         atoms = extractor.extract_from_text(source_text)
         if chapter:
             atoms = [a for a in atoms if a.source_section and a.source_section.startswith(chapter)]
@@ -97,6 +111,18 @@ def main() -> None:
     parser.add_argument("--openai-key", help="OpenAI API key")
     parser.add_argument("--gemini", action="store_true", help="Use Gemini instead of OpenAI")
     parser.add_argument("--google-key", help="Google API key")
+    parser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=10,
+        help="Sections sent per LLM request",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        default=str(DEFAULT_CACHE_PATH),
+        help="JSON file caching LLM extractions across runs",
+    )
+    parser.add_argument("--no-llm-cache", action="store_true", help="Disable the LLM disk cache")
     args = parser.parse_args()
 
     atoms = _load_atoms_from_source(args)
@@ -105,10 +131,13 @@ def main() -> None:
 
     if args.dump_atoms:
         out = Path(args.dump_atoms)
-        out.write_text(
-            json.dumps([atom.to_dict() for atom in atoms], indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        payload = [atom.to_dict() for atom in atoms]
+        if HAVE_ORJSON:
+            # Same bytes as the json.dumps branch, without building the
+            # intermediate str.
+            out.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            out.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
         print(f"Wrote atoms to: {out}")
 
     if args.show_atoms:
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import os
 import re
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 from .finlex import find_section_references, split_into_sections
 from .models import ConditionLiteral, LogicAtom, Section
@@ -63,69 +69,178 @@ TRIGGER_PATTERNS: list[tuple[re.Pattern[str], ConditionLiteral]] = [
     ),
 ]
 
+# The first matching entry wins, so the tram driver phrase must precede the
+# generic "kuljettaj" it contains.
 SUBJECT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"\braitiovaunun\s+kuljettaj", flags=re.IGNORECASE), "tram_driver"),
     (re.compile(r"\bkuljettaj", flags=re.IGNORECASE), "driver"),
     (re.compile(r"\bpolkupyöräilij", flags=re.IGNORECASE), "cyclist"),
     (re.compile(r"\bjalankulkij", flags=re.IGNORECASE), "pedestrian"),
-    (re.compile(r"\braitiovaunun\s+kuljettaj", flags=re.IGNORECASE), "tram_driver"),
 ]
 
-SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Matches the terminator and the whitespace after it; the terminator stays with
+# its sentence. Avoiding a lookbehind lets the engine jump straight to
+# candidate punctuation instead of testing every whitespace run.
+SENTENCE_BOUNDARY_RE = re.compile(r"[.!?]\s+")
+
+# Extraction runs in-process unless NEURAL_LEX_WORKERS asks for more than one
+# worker: per-section regex work is cheap enough that process start-up and
+# pickling outweigh it on typical statutes, and a pool would require callers on
+# spawn platforms to guard their entry point with ``if __name__ == "__main__"``.
+WORKERS_ENV = "NEURAL_LEX_WORKERS"
+
+
+_ESCAPE_RE = re.compile(r"\\.")
+
+
+def _fuse_patterns(patterns: list[tuple[re.Pattern[str], object]]) -> re.Pattern[str]:
+    # Fused patterns are compiled case-sensitively and matched against text
+    # lower-cased once per sentence, which is cheaper than Unicode IGNORECASE
+    # matching in every scan. That only works while every table entry is lower
+    # case, so anything else is rejected here rather than silently never
+    # matching (escapes such as \S are exempt).
+    #
+    # Each alternative is wrapped in a zero-width lookahead so that one
+    # finditer pass reports a hit at every position, including hits that
+    # overlap; at a single position the lowest index wins. Group ``p<i>`` maps
+    # back to ``patterns[i]``. Every table entry starts at a word boundary, so
+    # the leading ``\b`` only rejects positions no entry could match.
+    for pattern, _ in patterns:
+        literal_text = _ESCAPE_RE.sub("", pattern.pattern)
+        if literal_text != literal_text.lower():
+            raise ValueError(f"Extractor patterns must be lower case: {pattern.pattern!r}")
+    alternatives = "|".join(
+        f"(?P<p{idx}>{pattern.pattern})" for idx, (pattern, _) in enumerate(patterns)
+    )
+    return re.compile(f"\\b(?=(?:{alternatives}))")
+
+
+def _matched_indices(fused: re.Pattern[str], sentence: str) -> set[int]:
+    return {int(match.lastgroup[1:]) for match in fused.finditer(sentence)}  # type: ignore[index]
+
+
+def _first_matched_index(fused: re.Pattern[str], sentence: str) -> int | None:
+    best: int | None = None
+    for match in fused.finditer(sentence):
+        idx = int(match.lastgroup[1:])  # type: ignore[index]
+        if best is None or idx < best:
+            best = idx
+            if idx == 0:
+                break
+    return best
+
+
+_ACTION_RE = _fuse_patterns(ACTION_PATTERNS)
+_TRIGGER_RE = _fuse_patterns(TRIGGER_PATTERNS)
+_SUBJECT_RE = _fuse_patterns(SUBJECT_PATTERNS)
+
+# Ordered by precedence: a prohibition outranks an obligation, which outranks
+# a permission, regardless of where in the sentence each marker appears.
+_MODALITY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (MUST_NOT_RE, "must_not"),
+    (MUST_RE, "must"),
+    (MAY_RE, "may"),
+]
+_MODALITY_RE = _fuse_patterns(_MODALITY_PATTERNS)
+
+
+# The underscored helpers take already lower-cased text so a sentence is folded
+# once for all of its scans; the public detect_* functions fold for the caller.
+def _modality_of(folded: str) -> str | None:
+    idx = _first_matched_index(_MODALITY_RE, folded)
+    if idx is None:
+        return None
+    return _MODALITY_PATTERNS[idx][1]
+
+
+def _action_of(folded: str) -> str:
+    idx = _first_matched_index(_ACTION_RE, folded)
+    if idx is None:
+        return "comply"
+    return ACTION_PATTERNS[idx][1]
+
+
+def _subject_of(folded: str) -> str:
+    idx = _first_matched_index(_SUBJECT_RE, folded)
+    if idx is None:
+        return "driver"
+    return SUBJECT_PATTERNS[idx][1]
+
+
+def _conditions_of(folded: str) -> list[ConditionLiteral]:
+    found: dict[str, ConditionLiteral] = {}
+    for idx in sorted(_matched_indices(_TRIGGER_RE, folded)):
+        literal = TRIGGER_PATTERNS[idx][1]
+        found[literal.name] = literal
+    return list(found.values())
 
 
 def detect_modality(sentence: str) -> str | None:
-    if MUST_NOT_RE.search(sentence):
-        return "must_not"
-    if MUST_RE.search(sentence):
-        return "must"
-    if MAY_RE.search(sentence):
-        return "may"
-    return None
+    return _modality_of(sentence.lower())
 
 
 def detect_action(sentence: str) -> str:
-    for pattern, action in ACTION_PATTERNS:
-        if pattern.search(sentence):
-            return action
-    return "comply"
+    return _action_of(sentence.lower())
 
 
 def detect_subject(sentence: str) -> str:
-    for pattern, subject in SUBJECT_PATTERNS:
-        if pattern.search(sentence):
-            return subject
-    return "driver"
+    return _subject_of(sentence.lower())
 
 
 def detect_conditions(sentence: str) -> list[ConditionLiteral]:
-    found: dict[str, ConditionLiteral] = {}
-    for pattern, literal in TRIGGER_PATTERNS:
-        if pattern.search(sentence):
-            found[literal.name] = literal
-    return list(found.values())
+    return _conditions_of(sentence.lower())
+
+
+@lru_cache(maxsize=4096)
+def _heading_conditions(heading: str) -> tuple[ConditionLiteral, ...]:
+    # Headings recur when the same statute is extracted again (the section
+    # split is cached too) and for boilerplate titles such as repealed sections.
+    return tuple(detect_conditions(heading))
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    start = 0
+    for boundary in SENTENCE_BOUNDARY_RE.finditer(text):
+        sentence = text[start : boundary.start() + 1].strip()
+        start = boundary.end()
+        if sentence:
+            yield sentence
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
 
 
 def extract_logic_atoms_from_section(section: Section) -> list[LogicAtom]:
     atoms: list[LogicAtom] = []
-    heading_conditions = detect_conditions(section.heading)
-    sentences = [s.strip() for s in SENTENCE_SPLIT_RE.split(section.text) if s.strip()]
-    for idx, sentence in enumerate(sentences, start=1):
-        modality = detect_modality(sentence)
+    # Any modal marker found in a sentence is also found in the whole body, so
+    # one scan rules out sections (e.g. definitions) that cannot yield atoms.
+    if _MODALITY_RE.search(section.text.lower()) is None:
+        return atoms
+    heading_conditions = _heading_conditions(section.heading)
+    # Trigger literals are already unique by name, so sentences without triggers
+    # of their own reuse the heading literals as-is and only the rest copy this.
+    heading_by_name = {literal.name: literal for literal in heading_conditions}
+    for idx, sentence in enumerate(_iter_sentences(section.text), start=1):
+        folded = sentence.lower()
+        modality = _modality_of(folded)
         if modality is None:
             continue
-        refs = find_section_references(sentence)
-        merged_conditions: dict[str, ConditionLiteral] = {
-            literal.name: literal for literal in heading_conditions
-        }
-        for literal in detect_conditions(sentence):
-            merged_conditions[literal.name] = literal
+        refs = tuple(map(sys.intern, find_section_references(sentence)))
+        sentence_conditions = _conditions_of(folded)
+        if sentence_conditions:
+            merged_conditions = heading_by_name.copy()
+            for literal in sentence_conditions:
+                merged_conditions[literal.name] = literal
+            conditions = list(merged_conditions.values())
+        else:
+            conditions = list(heading_conditions)
         atoms.append(
             LogicAtom(
                 rule_id=f"TLL_{section.number}_{idx}",
-                subject=detect_subject(sentence),
-                action=detect_action(sentence),
+                subject=_subject_of(folded),
+                action=_action_of(folded),
                 modality=modality,  # type: ignore[arg-type]
-                conditions=list(merged_conditions.values()),
+                conditions=conditions,
                 references=refs,
                 source_section=section.number,
                 source_text=sentence,
@@ -134,15 +249,37 @@ def extract_logic_atoms_from_section(section: Section) -> list[LogicAtom]:
     return atoms
 
 
+def _worker_count() -> int:
+    configured = os.environ.get(WORKERS_ENV, "").strip()
+    if not configured:
+        return 1
+    try:
+        workers = int(configured)
+    except ValueError:
+        raise ValueError(
+            f"{WORKERS_ENV} must be a positive integer, got {configured!r}"
+        ) from None
+    if workers < 1:
+        raise ValueError(f"{WORKERS_ENV} must be a positive integer, got {configured!r}")
+    return workers
+
+
 def extract_logic_atoms(
     sections: list[Section], chapter_filter: str | None = None
 ) -> list[LogicAtom]:
-    atoms: list[LogicAtom] = []
-    for section in sections:
-        if chapter_filter is not None and section.chapter != chapter_filter:
-            continue
-        atoms.extend(extract_logic_atoms_from_section(section))
-    return atoms
+    selected = [
+        section
+        for section in sections
+        if chapter_filter is None or section.chapter == chapter_filter
+    ]
+    workers = min(_worker_count(), len(selected))
+    if workers <= 1:
+        per_section = map(extract_logic_atoms_from_section, selected)
+        return list(chain.from_iterable(per_section))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        per_section = executor.map(extract_logic_atoms_from_section, selected, chunksize=8)
+        return list(chain.from_iterable(per_section))
 
 
 def extract_logic_atoms_from_text(text: str, chapter_filter: str | None = None) -> list[LogicAtom]:
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
 from .models import Section
 
+if TYPE_CHECKING:
+    import requests
+
 CHAPTER_PATTERNS = [
     re.compile(r"^\s*Luku\s+(\d+)\b(?:\s*[-–:]\s*(.+))?\s*$", flags=re.IGNORECASE),
     re.compile(r"^\s*(\d+)\s+luku\b(?:\s*[-–:]\s*(.+))?\s*$", flags=re.IGNORECASE),
@@ -15,22 +18,50 @@ CHAPTER_PATTERNS = [
 SECTION_PATTERN = re.compile(r"^\s*(\d+[a-zA-Z]?)\s*§\s*(.*)$")
 SECTION_REFERENCE_PATTERN = re.compile(r"\b(\d+[a-zA-Z]?)\s*§")
 
+# lxml is an optional C-backed tree builder; it yields the same text as the
+# pure-Python html.parser at roughly twice the speed on Finlex-sized pages.
+HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+
+@lru_cache(maxsize=None)
+def _http_session() -> requests.Session:
+    # One pooled session keeps the connection to Finlex alive across fetches.
+    # requests and bs4 are imported on first use: they dominate start-up time
+    # and are not needed when atoms come from JSON or a local text file.
+    import requests
+
+    return requests.Session()
+
 
 def fetch_finlex_html(url: str, timeout: int = 30) -> str:
-    response = requests.get(url, timeout=timeout)
+    response = _http_session().get(url, timeout=timeout)
     response.raise_for_status()
-    return response.text
+    # Decode the body directly instead of going through ``response.text``: that
+    # sniffs the charset with a full pass over the body when the header omits
+    # one. Finlex serves UTF-8, so use it unless a charset is declared.
+    content_type = response.headers.get("Content-Type", "").lower()
+    encoding = response.encoding if "charset=" in content_type else None
+    return response.content.decode(encoding or "utf-8", errors="replace")
 
 
 def finlex_html_to_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, HTML_PARSER)
     main = soup.find("main")
     root = main if main is not None else soup
     return root.get_text("\n")
 
 
 def split_into_sections(text: str) -> list[Section]:
-    sections: list[Section] = []
+    # Sections are mutable, so callers get fresh objects built from the cached
+    # field tuples rather than shared instances.
+    return [Section(*fields) for fields in _split_into_section_fields(text)]
+
+
+@lru_cache(maxsize=8)
+def _split_into_section_fields(text: str) -> tuple[tuple[str, str, str, str | None], ...]:
+    sections: list[tuple[str, str, str, str | None]] = []
     chapter: str | None = None
     chapter_heading = ""
     current_number: str | None = None
@@ -45,14 +76,7 @@ def split_into_sections(text: str) -> list[Section]:
         heading = current_heading.strip()
         if chapter_heading:
             heading = f"{heading} ({chapter_heading})".strip()
-        sections.append(
-            Section(
-                number=current_number,
-                heading=heading,
-                text=body,
-                chapter=chapter,
-            )
-        )
+        sections.append((current_number, heading, body, chapter))
         current_number = None
         current_heading = ""
         current_lines = []
@@ -85,16 +109,17 @@ def split_into_sections(text: str) -> list[Section]:
             current_lines.append(line)
 
     flush()
-    return sections
+    return tuple(sections)
 
 
 def find_section_references(text: str) -> list[str]:
-    refs = []
-    for match in SECTION_REFERENCE_PATTERN.finditer(text):
-        ref = match.group(1)
-        if ref not in refs:
-            refs.append(ref)
-    return refs
+    # Every reference ends in the section sign, and most sentences have none;
+    # a substring test is far cheaper than starting the regex engine.
+    if "§" not in text:
+        return []
+    # The pattern has a single group, so findall yields the section numbers
+    # directly; dict.fromkeys dedupes them while keeping first-seen order.
+    return list(dict.fromkeys(SECTION_REFERENCE_PATTERN.findall(text)))
 
 
 def group_sections_by_chapter(sections: list[Section]) -> dict[str, list[Section]]:
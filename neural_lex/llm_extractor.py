@@ -1,10 +1,44 @@
+import hashlib
 import json
 import os
+import tempfile
+from pathlib import Path
 from typing import Any, Protocol
 
 from .models import LogicAtom, Section
 from .finlex import split_into_sections
 
+_ATOM_SCHEMA = """
+Schema for LogicAtom:
+{
+  "rule_id": "string",
+  "subject": "driver" | "cyclist" | "pedestrian" | "tram_driver",
+  "action": "yield" | "stop" | "overtake" | "turn" | "proceed" | "comply",
+  "modality": "must" | "must_not" | "may",
+  "conditions": ["condition1", "!condition2"],
+  "references": ["section_number1", "section_number2"],
+  "source_section": "string",
+  "source_text": "string"
+}
+"""
+
+SYSTEM_PROMPT = (
+    "\nYou are a legal logic extractor. Transform the following Finnish traffic law section "
+    "into a JSON list of LogicAtoms."
+    + _ATOM_SCHEMA
+    + 'Return ONLY a JSON object with a key "atoms" containing the list.\n'
+)
+
+BATCH_SYSTEM_PROMPT = (
+    "\nYou are a legal logic extractor. Transform each of the following Finnish traffic law "
+    "sections into a JSON list of LogicAtoms."
+    + _ATOM_SCHEMA
+    + 'Return ONLY a JSON object with a key "sections" mapping each section number '
+    "to its list of atoms.\n"
+)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "neural_lex" / "atoms.json"
+
 class LLMProvider(Protocol):
     def query(self, prompt: str, system_prompt: str | None = None) -> str:
         ...
@@ -15,6 +49,10 @@ class OpenAIProvider:
         self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
         self.model = model
 
+    @property
+    def model_name(self) -> str:
+        return self.model
+
     def query(self, prompt: str, system_prompt: str | None = None) -> str:
         messages = []
         if system_prompt:
@@ -33,6 +71,7 @@ class GeminiProvider:
         import google.generativeai as genai
         genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
         self.model = genai.GenerativeModel(model)
+        self.model_name = model
 
     def query(self, prompt: str, system_prompt: str | None = None) -> str:
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
@@ -42,18 +81,49 @@ class GeminiProvider:
         )
         return response.text
 
+def _section_prompt(section: Section) -> str:
+    return f"Section {section.number}: {section.heading}\n\nText:\n{section.text}"
+
+
 class RecursiveLLMExtractor:
-    def __init__(self, provider: LLMProvider):
+    def __init__(
+        self,
+        provider: LLMProvider,
+        batch_size: int = 10,
+        cache_path: str | Path | None = None,
+    ):
         self.provider = provider
+        self.batch_size = max(1, batch_size)
         self.cache: dict[str, list[LogicAtom]] = {}
+        # Raw atom dicts keyed by a hash of model + prompt, persisted as JSON so
+        # unchanged sections are never sent to the provider twice.
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.disk_cache: dict[str, list[dict[str, Any]]] = self._load_disk_cache()
 
     def extract_from_text(self, text: str) -> list[LogicAtom]:
         sections = split_into_sections(text)
+        self.prefetch(sections)
         all_atoms = []
         for section in sections:
             all_atoms.extend(self.extract_recursive(section, sections))
+        self.save_disk_cache()
         return all_atoms
 
+    def prefetch(self, sections: list[Section]) -> None:
+        # Fill the section cache up front with batched calls, so the recursive
+        # walk below resolves from memory instead of one round trip per section.
+        pending = [
+            s for s in sections if s.number not in self.cache and not self._load_cached(s)
+        ]
+        for start in range(0, len(pending), self.batch_size):
+            group = pending[start : start + self.batch_size]
+            batched = self._call_llm_for_sections(group) if len(group) > 1 else {}
+            for section in group:
+                if section.number in batched:
+                    self._store(section, batched[section.number])
+                else:
+                    self.cache[section.number] = self._call_llm_for_section(section)
+
     def extract_recursive(self, section: Section, all_sections: list[Section], depth: int = 0, max_depth: int = 3) -> list[LogicAtom]:
         if section.number in self.cache:
             return self.cache[section.number]
@@ -62,6 +132,8 @@ class RecursiveLLMExtractor:
             return []
 
         # 1. Extract atoms from current section
+        if self._load_cached(section):
+            return self.cache[section.number]
         atoms = self._call_llm_for_section(section)
         
         # 2. Identify references and recursively resolve them
@@ -82,28 +154,88 @@ class RecursiveLLMExtractor:
         self.cache[section.number] = atoms
         return atoms
 
+    def _cache_key(self, section: Section) -> str:
+        # Providers may expose model_name so switching models never serves atoms
+        # extracted by another one; older providers fall back to their class.
+        model = getattr(self.provider, "model_name", type(self.provider).__name__)
+        payload = f"{model}\n{SYSTEM_PROMPT}\n{_section_prompt(section)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_cached(self, section: Section) -> bool:
+        if self.cache_path is None:
+            return False
+        key = self._cache_key(section)
+        raw_atoms = self.disk_cache.get(key)
+        if raw_atoms is None:
+            return False
+        try:
+            atoms = [LogicAtom.from_dict(raw) for raw in raw_atoms]
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # A damaged entry is a cache miss; drop it so the section is
+            # extracted again and the fresh result replaces it on save.
+            print(f"Ignoring bad LLM cache entry for section {section.number}: {e}")
+            del self.disk_cache[key]
+            return False
+        self.cache[section.number] = atoms
+        return True
+
+    def _store(self, section: Section, atoms: list[LogicAtom]) -> None:
+        self.cache[section.number] = atoms
+        if self.cache_path is not None:
+            self.disk_cache[self._cache_key(section)] = [atom.to_dict() for atom in atoms]
+
+    def _load_disk_cache(self) -> dict[str, list[dict[str, Any]]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable LLM cache {self.cache_path}: {e}")
+            return {}
+        if not isinstance(cached, dict):
+            print(f"Ignoring LLM cache {self.cache_path}: expected a JSON object")
+            return {}
+        return cached
+
+    def save_disk_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and swap it in, so an interrupted run never
+        # leaves a truncated cache behind.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self.disk_cache, handle, ensure_ascii=False)
+            os.replace(tmp_name, self.cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     def _call_llm_for_section(self, section: Section) -> list[LogicAtom]:
-        system_prompt = """
-You are a legal logic extractor. Transform the following Finnish traffic law section into a JSON list of LogicAtoms.
-Schema for LogicAtom:
-{
-  "rule_id": "string",
-  "subject": "driver" | "cyclist" | "pedestrian" | "tram_driver",
-  "action": "yield" | "stop" | "overtake" | "turn" | "proceed" | "comply",
-  "modality": "must" | "must_not" | "may",
-  "conditions": ["condition1", "!condition2"],
-  "references": ["section_number1", "section_number2"],
-  "source_section": "string",
-  "source_text": "string"
-}
-Return ONLY a JSON object with a key "atoms" containing the list.
-"""
-        prompt = f"Section {section.number}: {section.heading}\n\nText:\n{section.text}"
-        
         try:
-            response_text = self.provider.query(prompt, system_prompt)
+            response_text = self.provider.query(_section_prompt(section), SYSTEM_PROMPT)
             data = json.loads(response_text)
-            return [LogicAtom.from_dict(raw) for raw in data.get("atoms", [])]
+            atoms = [LogicAtom.from_dict(raw) for raw in data.get("atoms", [])]
         except Exception as e:
             print(f"Error extracting from section {section.number}: {e}")
             return []
+        # Only successful responses are persisted; a failed call is retried next run.
+        self._store(section, atoms)
+        return atoms
+
+    def _call_llm_for_sections(self, sections: list[Section]) -> dict[str, list[LogicAtom]]:
+        prompt = "\n\n---\n\n".join(_section_prompt(section) for section in sections)
+        try:
+            response_text = self.provider.query(prompt, BATCH_SYSTEM_PROMPT)
+            data = json.loads(response_text)
+            return {
+                str(number): [LogicAtom.from_dict(raw) for raw in raw_atoms]
+                for number, raw_atoms in data.get("sections", {}).items()
+            }
+        except Exception as e:
+            numbers = ", ".join(section.number for section in sections)
+            print(f"Error extracting from sections {numbers}: {e}")
+            return {}
@@ -1,31 +1,44 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Literal
 
 Modality = Literal["must", "must_not", "may"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionLiteral:
     name: str
     value: bool = True
 
     @classmethod
     def parse(cls, token: str) -> "ConditionLiteral":
-        token = token.strip()
-        if token.startswith("!"):
-            return cls(name=token[1:], value=False)
-        lowered = token.lower()
-        if lowered.startswith("not "):
-            return cls(name=token[4:].strip(), value=False)
-        return cls(name=token, value=True)
+        return _parse_condition_literal(cls, token)
 
     def as_token(self) -> str:
         return self.name if self.value else f"!{self.name}"
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_condition_literal(cls: type[ConditionLiteral], token: str) -> ConditionLiteral:
+    # Literals are immutable and condition vocabularies are small, so every
+    # occurrence of a token can share one instance instead of re-running the
+    # frozen dataclass __init__.
+    token = token.strip()
+    if token.startswith("!"):
+        return cls(name=sys.intern(token[1:]), value=False)
+    if token[:4].lower() == "not ":
+        return cls(name=sys.intern(token[4:].strip()), value=False)
+    return cls(name=sys.intern(token), value=True)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class Section:
     number: str
     heading: str
@@ -33,23 +46,21 @@ class Section:
     chapter: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LogicAtom:
     rule_id: str
     subject: str
     action: str
     modality: Modality
     conditions: list[ConditionLiteral] = field(default_factory=list)
-    references: list[str] = field(default_factory=list)
+    references: tuple[str, ...] = ()
     source_section: str | None = None
     source_text: str | None = None
     priority: int = 0
 
     @classmethod
     def from_dict(cls, raw: dict[str, Any]) -> "LogicAtom":
-        raw_conditions: list[str] = []
-        if "conditions" in raw and raw["conditions"] is not None:
-            raw_conditions.extend(raw["conditions"])
+        raw_conditions: list[str] = list(raw.get("conditions") or ())
         trigger = raw.get("trigger")
         if trigger:
             if isinstance(trigger, str):
@@ -65,16 +76,20 @@ class LogicAtom:
         if modality not in ("must", "must_not", "may"):
             raise ValueError(f"Unsupported modality: {modality}")
 
-        references = raw.get("references") or []
+        references = raw.get("references") or ()
 
+        # Identifiers, subject/action/modality and section numbers come from
+        # small vocabularies or are used as lookup keys; interning them lets
+        # every atom share one string object per value and makes the
+        # symbolic and section-index lookups identity hits.
         return cls(
-            rule_id=raw["rule_id"],
-            subject=raw.get("subject", "driver"),
-            action=action,
-            modality=modality,
+            rule_id=_intern(raw["rule_id"]),
+            subject=_intern(raw.get("subject", "driver")),
+            action=_intern(action),
+            modality=sys.intern(modality),  # type: ignore[arg-type]
             conditions=[ConditionLiteral.parse(token) for token in raw_conditions],
-            references=list(references),
-            source_section=raw.get("source_section"),
+            references=tuple(sys.intern(str(ref)) for ref in references),
+            source_section=_intern(raw.get("source_section")),
             source_text=raw.get("source_text"),
             priority=int(raw.get("priority", 0)),
         )
@@ -86,14 +101,14 @@ class LogicAtom:
             "action": self.action,
             "modality": self.modality,
             "conditions": [c.as_token() for c in self.conditions],
-            "references": self.references,
+            "references": list(self.references),
             "source_section": self.source_section,
             "source_text": self.source_text,
             "priority": self.priority,
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Conflict:
     rule_a: str
     rule_b: str
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Iterable
 
+from ._bits import iter_bits
 from .models import LogicAtom
 
 
@@ -14,29 +15,59 @@ def build_section_rule_index(atoms: list[LogicAtom]) -> dict[str, list[str]]:
     return index
 
 
+def _union(masks: list[int], selector: int) -> int:
+    combined = 0
+    for position in iter_bits(selector):
+        combined |= masks[position]
+    return combined
+
+
 def resolve_rule_references(
     atoms: list[LogicAtom], max_depth: int = 3
 ) -> dict[str, set[str]]:
     section_index = build_section_rule_index(atoms)
     rule_by_id = {atom.rule_id: atom for atom in atoms}
-    resolved: dict[str, set[str]] = {}
 
-    for atom in atoms:
+    # Every section number gets a bit position, so a set of sections is a
+    # plain int and a union of sections is a handful of ORs.
+    section_bits: dict[str, int] = {}
+
+    def section_position(ref: str) -> int:
+        if ref not in section_bits:
+            section_bits[ref] = len(section_bits)
+        return section_bits[ref]
+
+    def section_mask(refs: Iterable[str]) -> int:
+        mask = 0
+        for ref in refs:
+            mask |= 1 << section_position(ref)
+        return mask
+
+    rules_at: dict[int, list[str]] = {}
+    next_sections: dict[int, int] = {}
+    for section, rule_ids in section_index.items():
+        position = section_position(section)
+        rules_at[position] = rule_ids
+        next_sections[position] = section_mask(
+            ref for rule_id in rule_ids for ref in rule_by_id[rule_id].references
+        )
+    starts = [section_mask(atom.references) for atom in atoms]
+
+    # The sections within d hops of a set of references are the union of the
+    # sections within d hops of each one, so every section's neighbourhood is
+    # grown once, one hop per level, and shared by all atoms.
+    reach = [1 << position for position in range(len(section_bits))]
+    for _ in range(max_depth - 1):
+        reach = [
+            ball | _union(reach, next_sections.get(position, 0))
+            for position, ball in enumerate(reach)
+        ]
+
+    resolved: dict[str, set[str]] = {}
+    for atom, start in zip(atoms, starts):
         discovered: set[str] = set()
-        queue: deque[tuple[str, int]] = deque((ref, 1) for ref in atom.references)
-        seen_sections: set[str] = set()
-
-        while queue:
-            section_ref, depth = queue.popleft()
-            if section_ref in seen_sections or depth > max_depth:
-                continue
-            seen_sections.add(section_ref)
-            for linked_rule_id in section_index.get(section_ref, []):
-                discovered.add(linked_rule_id)
-                linked_rule = rule_by_id.get(linked_rule_id)
-                if linked_rule is None:
-                    continue
-                for nested_ref in linked_rule.references:
-                    queue.append((nested_ref, depth + 1))
+        if max_depth >= 1:
+            for position in iter_bits(_union(reach, start)):
+                discovered.update(rules_at.get(position, ()))
         resolved[atom.rule_id] = discovered
     return resolved
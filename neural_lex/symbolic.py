@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from itertools import combinations, product
+from functools import lru_cache
 from typing import Any, Iterable
 
 try:
@@ -13,17 +14,48 @@ except ModuleNotFoundError:
     ModelRef = Any  # type: ignore[misc,assignment]
     HAVE_Z3 = False
 
-from .models import Conflict, LogicAtom
+# python-sat only backs the fallback, so skip its import when Z3 is present.
+HAVE_PYSAT = False
+if not HAVE_Z3:
+    try:
+        from pysat.solvers import Glucose3
 
-DEFAULT_INCOMPATIBLE_ACTIONS = {
-    ("yield", "proceed"),
-    ("stop", "proceed"),
-    ("stop", "overtake"),
-}
+        HAVE_PYSAT = True
+    except ModuleNotFoundError:
+        pass
+
+from ._bits import iter_bits
+from .models import ConditionLiteral, Conflict, LogicAtom
+
+# Pairs are stored in normalized (sorted) order so the default needs no work
+# in _normalize_pairs.
+DEFAULT_INCOMPATIBLE_ACTIONS: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("proceed", "yield"),
+        ("proceed", "stop"),
+        ("overtake", "stop"),
+    }
+)
+
+_CONFLICT_REASON = "Mutually exclusive obligations under overlapping triggers"
 
 
 def symbolic_backend_name() -> str:
-    return "z3" if HAVE_Z3 else "fallback"
+    if HAVE_Z3:
+        return "z3"
+    return "pysat" if HAVE_PYSAT else "fallback"
+
+
+# Z3 variables are identified by name, so one Bool per name is shared by every
+# compiler in the process instead of being rebuilt on each call.
+@lru_cache(maxsize=None)
+def _mk_pred(name: str) -> BoolRef:
+    return Bool(name)
+
+
+@lru_cache(maxsize=None)
+def _mk_act(name: str) -> BoolRef:
+    return Bool(f"must_{name}")
 
 
 @dataclass
@@ -35,7 +67,7 @@ class SymbolicCompiler:
         if not HAVE_Z3:
             raise RuntimeError("Z3 is not available")
         if name not in self.predicates:
-            self.predicates[name] = Bool(name)
+            self.predicates[name] = _mk_pred(name)
         return self.predicates[name]
 
     def action(self, name: str) -> BoolRef:
@@ -43,19 +75,23 @@ class SymbolicCompiler:
             raise RuntimeError("Z3 is not available")
         key = f"must_{name}"
         if key not in self.actions:
-            self.actions[key] = Bool(key)
+            self.actions[key] = _mk_act(name)
         return self.actions[key]
 
     def condition_expr(self, atom: LogicAtom) -> BoolRef:
         if not HAVE_Z3:
             raise RuntimeError("Z3 is not available")
-        clauses: list[BoolRef] = []
-        for literal in atom.conditions:
-            predicate = self.predicate(literal.name)
-            clauses.append(predicate if literal.value else Not(predicate))
-        if not clauses:
+        conditions = atom.conditions
+        if not conditions:
             return BoolVal(True)
-        return And(clauses)
+        # Most rules have a single condition; it needs no And() around it.
+        if len(conditions) == 1:
+            return self.literal_expr(conditions[0])
+        return And([self.literal_expr(literal) for literal in conditions])
+
+    def literal_expr(self, literal: ConditionLiteral) -> BoolRef:
+        predicate = self.predicate(literal.name)
+        return predicate if literal.value else Not(predicate)
 
     def requirement_expr(self, atom: LogicAtom) -> BoolRef | None:
         if atom.modality == "may":
@@ -70,7 +106,9 @@ class SymbolicCompiler:
         return None
 
 
-def _normalize_pairs(pairs: Iterable[tuple[str, str]]) -> set[tuple[str, str]]:
+def _normalize_pairs(pairs: Iterable[tuple[str, str]]) -> frozenset[tuple[str, str]]:
+    if isinstance(pairs, frozenset) and all(left < right for left, right in pairs):
+        return pairs
     normalized: set[tuple[str, str]] = set()
     for left, right in pairs:
         if left == right:
@@ -79,27 +117,51 @@ def _normalize_pairs(pairs: Iterable[tuple[str, str]]) -> set[tuple[str, str]]:
             normalized.add((left, right))
         else:
             normalized.add((right, left))
-    return normalized
+    return frozenset(normalized)
+
+
+def _incompatible_pairs(
+    incompatible_actions: Iterable[tuple[str, str]] | None,
+) -> frozenset[tuple[str, str]]:
+    if not incompatible_actions:
+        return DEFAULT_INCOMPATIBLE_ACTIONS
+    return _normalize_pairs(incompatible_actions)
 
 
 def _add_incompatible_action_constraints(
     solver: Any,
     compiler: SymbolicCompiler,
-    incompatible_actions: set[tuple[str, str]],
+    incompatible_actions: frozenset[tuple[str, str]],
 ) -> None:
     if not HAVE_Z3:
         raise RuntimeError("Z3 is not available")
-    for left, right in incompatible_actions:
-        solver.add(Not(And(compiler.action(left), compiler.action(right))))
-
-
-def _condition_overlap(atom_a: LogicAtom, atom_b: LogicAtom) -> bool:
-    values: dict[str, bool] = {}
-    for literal in [*atom_a.conditions, *atom_b.conditions]:
-        if literal.name in values and values[literal.name] != literal.value:
-            return False
-        values[literal.name] = literal.value
-    return True
+    solver.add(
+        *(
+            Not(And(compiler.action(left), compiler.action(right)))
+            # Sorted so variables are created, and models come out, the same way
+            # on every run regardless of string hash seeding.
+            for left, right in sorted(incompatible_actions)
+        )
+    )
+
+
+def _encode(atoms: list[LogicAtom]) -> tuple[dict[str, int], list[int], list[int]]:
+    # Every predicate gets a bit; an atom's conditions become one mask of the
+    # predicates it needs true and one of those it needs false.
+    name_ids: dict[str, int] = {}
+    pos_masks: list[int] = []
+    neg_masks: list[int] = []
+    for atom in atoms:
+        pos = neg = 0
+        for literal in atom.conditions:
+            bit = 1 << name_ids.setdefault(literal.name, len(name_ids))
+            if literal.value:
+                pos |= bit
+            else:
+                neg |= bit
+        pos_masks.append(pos)
+        neg_masks.append(neg)
+    return name_ids, pos_masks, neg_masks
 
 
 def _requirement_signature(atom: LogicAtom) -> tuple[str, bool] | None:
@@ -112,28 +174,13 @@ def _requirement_signature(atom: LogicAtom) -> tuple[str, bool] | None:
     return None
 
 
-def _requirements_conflict(
-    requirement_a: tuple[str, bool],
-    requirement_b: tuple[str, bool],
-    incompatible_actions: set[tuple[str, str]],
-) -> bool:
-    action_a, positive_a = requirement_a
-    action_b, positive_b = requirement_b
-    if action_a == action_b and positive_a != positive_b:
-        return True
-    if positive_a and positive_b:
-        key = (action_a, action_b) if action_a < action_b else (action_b, action_a)
-        return key in incompatible_actions
-    return False
-
-
 def build_solver(
     atoms: list[LogicAtom],
     incompatible_actions: set[tuple[str, str]] | None = None,
 ) -> tuple[Any, SymbolicCompiler]:
     if not HAVE_Z3:
         raise RuntimeError("z3-solver is not installed; install it to build the native solver.")
-    pairs = _normalize_pairs(incompatible_actions or DEFAULT_INCOMPATIBLE_ACTIONS)
+    pairs = _incompatible_pairs(incompatible_actions)
     compiler = SymbolicCompiler()
     solver = Solver()
     _add_incompatible_action_constraints(solver, compiler, pairs)
@@ -142,7 +189,12 @@ def build_solver(
         req = compiler.requirement_expr(atom)
         if req is None:
             continue
-        solver.add(Implies(compiler.condition_expr(atom), req))
+        # An unconditional rule asserts its requirement directly rather than
+        # behind an Implies(True, ...) the solver would have to simplify away.
+        if not atom.conditions:
+            solver.add(req)
+        else:
+            solver.add(Implies(compiler.condition_expr(atom), req))
 
     return solver, compiler
 
@@ -152,102 +204,249 @@ def check_scenario(
 ) -> tuple[bool, ModelRef | None]:
     if HAVE_Z3:
         solver, compiler = build_solver(atoms)
-        for predicate_name, value in assumptions.items():
-            predicate = compiler.predicate(predicate_name)
-            solver.add(predicate if value else Not(predicate))
-
-        if solver.check() == sat:
+        # Assumptions are passed to check() rather than asserted, so they stay
+        # retractable and the same solver can be asked about other scenarios.
+        assumed = [
+            compiler.predicate(name) if value else Not(compiler.predicate(name))
+            for name, value in assumptions.items()
+        ]
+        if solver.check(*assumed) == sat:
             return True, solver.model()
         return False, None
 
-    incompatible = _normalize_pairs(DEFAULT_INCOMPATIBLE_ACTIONS)
-    predicates = {literal.name for atom in atoms for literal in atom.conditions}
-    unknown = sorted(predicates - set(assumptions.keys()))
-    for values in product([False, True], repeat=len(unknown)):
-        model = dict(assumptions)
-        model.update(dict(zip(unknown, values)))
-        action_constraints: dict[str, bool] = {}
-        consistent = True
-        for atom in atoms:
-            if atom.modality == "may":
-                continue
-            if not all(model.get(literal.name, False) == literal.value for literal in atom.conditions):
-                continue
-            needed = atom.modality == "must"
-            if atom.action in action_constraints and action_constraints[atom.action] != needed:
-                consistent = False
-                break
-            action_constraints[atom.action] = needed
-
-        if not consistent:
+    return _fallback_check_scenario(atoms, assumptions)
+
+
+Requirement = tuple[tuple[str, bool], int, int, int]
+
+
+def _action_masks(
+    requirements: list[Requirement], true_mask: int, clashes: list[int], decided: int = -1
+) -> tuple[int, int] | None:
+    # Every action has a bit; the actions the active rules require and forbid
+    # are collected as two masks, so both kinds of contradiction are ANDs.
+    # Rules reading a predicate outside `decided` are not known to be active
+    # yet and are skipped.
+    must = must_not = 0
+    for (_, needed), action_bit, pos, neg in requirements:
+        if pos & ~true_mask or neg & true_mask or (pos | neg) & ~decided:
             continue
+        if needed:
+            must |= action_bit
+        else:
+            must_not |= action_bit
+        if must & must_not:
+            return None
+    for clash in clashes:
+        if must & clash == clash:
+            return None
+    return must, must_not
+
+
+def _search_true_mask(
+    unknown: list[int],
+    assumed_true: int,
+    requirements: list[Requirement],
+    clashes: list[int],
+) -> int | None:
+    # Try everything-false first; it is the answer whenever no rule needs a
+    # predicate switched on to stay consistent.
+    if _action_masks(requirements, assumed_true, clashes) is not None:
+        return assumed_true
+
+    # Otherwise only predicates used with both polarities need searching. A
+    # predicate that only ever appears positively (or only negatively) is set
+    # so that it deactivates its rules: fewer active obligations can never make
+    # a consistent scenario inconsistent.
+    positive = negative = 0
+    for _, _, pos, neg in requirements:
+        positive |= pos
+        negative |= neg
+    mixed = [bit for bit in unknown if bit & positive and bit & negative]
+    pure = assumed_true
+    undecided = 0
+    for bit in unknown:
+        if bit & negative and not bit & positive:
+            pure |= bit
+    for bit in mixed:
+        undecided |= bit
+
+    # Depth-first over the mixed predicates, False before True, which visits
+    # complete assignments in the same order as enumerating them all. A rule
+    # whose predicates are all decided stays active or inactive below that
+    # point, so a contradiction among such rules prunes the whole subtree.
+    def extend(depth: int, true_mask: int, decided: int) -> int | None:
+        if _action_masks(requirements, true_mask, clashes, decided) is None:
+            return None
+        if depth == len(mixed):
+            return true_mask
+        bit = mixed[depth]
+        found = extend(depth + 1, true_mask, decided | bit)
+        if found is None:
+            found = extend(depth + 1, true_mask | bit, decided | bit)
+        return found
+
+    return extend(0, pure, ~undecided)
 
-        for left, right in incompatible:
-            if action_constraints.get(left) is True and action_constraints.get(right) is True:
-                consistent = False
-                break
-        if consistent:
-            model.update({f"must_{k}": v for k, v in action_constraints.items()})
-            return True, model
-    return False, None
+
+def _fallback_check_scenario(
+    atoms: list[LogicAtom], assumptions: dict[str, bool]
+) -> tuple[bool, dict[str, bool] | None]:
+    # The model returned is a witness: any assignment under which the active
+    # rules agree, not the first one in enumeration order.
+    if not atoms:
+        return True, dict(assumptions)
+
+    name_ids, pos_masks, neg_masks = _encode(atoms)
+    # Each rule's requirement is worked out once, not once per candidate.
+    action_ids: dict[str, int] = {}
+    requirements: list[Requirement] = []
+    for signature, pos, neg in zip(map(_requirement_signature, atoms), pos_masks, neg_masks):
+        if signature is None:
+            continue
+        action_bit = 1 << action_ids.setdefault(signature[0], len(action_ids))
+        requirements.append((signature, action_bit, pos, neg))
+    clashes = [
+        1 << action_ids[left] | 1 << action_ids[right]
+        for left, right in DEFAULT_INCOMPATIBLE_ACTIONS
+        if left in action_ids and right in action_ids
+    ]
+    unknown = sorted(name for name in name_ids if name not in assumptions)
+    assumed_true = assumed_false = 0
+    for name, value in assumptions.items():
+        if name in name_ids:
+            if value:
+                assumed_true |= 1 << name_ids[name]
+            else:
+                assumed_false |= 1 << name_ids[name]
+
+    true_mask: int | None
+    if HAVE_PYSAT:
+        true_mask = _sat_true_mask(
+            len(name_ids), requirements, clashes, assumed_true, assumed_false
+        )
+    else:
+        true_mask = _search_true_mask(
+            [1 << name_ids[name] for name in unknown], assumed_true, requirements, clashes
+        )
+    if true_mask is None:
+        return False, None
+
+    model = dict(assumptions)
+    model.update((name, bool(true_mask >> name_ids[name] & 1)) for name in unknown)
+    action_constraints: dict[str, bool] = {}
+    for (action, needed), _, pos, neg in requirements:
+        if not (pos & ~true_mask or neg & true_mask):
+            action_constraints.setdefault(action, needed)
+    model.update({f"must_{k}": v for k, v in action_constraints.items()})
+    return True, model
+
+
+def _sat_true_mask(
+    predicate_count: int,
+    requirements: list[Requirement],
+    clashes: list[int],
+    assumed_true: int,
+    assumed_false: int,
+) -> int | None:
+    # Predicate bit p is SAT variable p + 1 and action bit k is variable
+    # predicate_count + k + 1; each rule is the clause "not all conditions, or
+    # the requirement".
+    clauses: list[list[int]] = []
+    for (_, needed), action_bit, pos, neg in requirements:
+        action_var = predicate_count + action_bit.bit_length()
+        clause = [-(p + 1) for p in iter_bits(pos)] + [p + 1 for p in iter_bits(neg)]
+        clause.append(action_var if needed else -action_var)
+        clauses.append(clause)
+    for clash in clashes:
+        clauses.append([-(predicate_count + k + 1) for k in iter_bits(clash)])
+    assumed = [p + 1 for p in iter_bits(assumed_true)]
+    assumed.extend(-(p + 1) for p in iter_bits(assumed_false))
+
+    with Glucose3(bootstrap_with=clauses) as solver:
+        if not solver.solve(assumptions=assumed):
+            return None
+        model = solver.get_model()
+    true_mask = 0
+    for literal in model:
+        if 0 < literal <= predicate_count:
+            true_mask |= 1 << (literal - 1)
+    return true_mask
+
+
+def _conflicting_pairs(
+    signatures: list[tuple[str, bool] | None],
+    pos_masks: list[int],
+    neg_masks: list[int],
+    incompatible_actions: frozenset[tuple[str, str]],
+) -> list[tuple[int, int]]:
+    # Sets of atoms are ints with one bit per atom index, so a whole row of the
+    # pair matrix is decided with a few ORs and ANDs.
+    bucket: dict[tuple[str, bool], int] = defaultdict(int)
+    needs_true: dict[int, int] = defaultdict(int)
+    needs_false: dict[int, int] = defaultdict(int)
+    contradictory = 0
+    for index, (signature, pos, neg) in enumerate(zip(signatures, pos_masks, neg_masks)):
+        bit = 1 << index
+        if signature is not None:
+            bucket[signature] |= bit
+        if pos & neg:
+            contradictory |= bit
+        for predicate in iter_bits(pos):
+            needs_true[predicate] |= bit
+        for predicate in iter_bits(neg):
+            needs_false[predicate] |= bit
+
+    # Two requirements can only clash on the same action with opposite
+    # polarity, or as two mandatory incompatible actions.
+    opponents: dict[tuple[str, bool], int] = defaultdict(int)
+    for action, positive in list(bucket):
+        opponents[(action, positive)] |= bucket.get((action, not positive), 0)
+    for left, right in incompatible_actions:
+        opponents[(left, True)] |= bucket.get((right, True), 0)
+        opponents[(right, True)] |= bucket.get((left, True), 0)
+
+    # Conditions are conjunctions of literals, so two triggers can hold at
+    # once unless some predicate must be both true and false across them.
+    found: list[tuple[int, int]] = []
+    for i, signature in enumerate(signatures):
+        if signature is None or contradictory >> i & 1:
+            continue
+        blocked = contradictory | ((2 << i) - 1)
+        for predicate in iter_bits(pos_masks[i]):
+            blocked |= needs_false.get(predicate, 0)
+        for predicate in iter_bits(neg_masks[i]):
+            blocked |= needs_true.get(predicate, 0)
+        hits = opponents[signature] & ~blocked
+        if not hits:
+            continue
+        # Scan the row's bits from the low end, so pairs come out in the same
+        # order as walking every pair.
+        row = bin(hits)[:1:-1]
+        j = row.find("1")
+        while j >= 0:
+            found.append((i, j))
+            j = row.find("1", j + 1)
+    return found
 
 
 def find_pairwise_conflicts(
     atoms: list[LogicAtom],
     incompatible_actions: set[tuple[str, str]] | None = None,
 ) -> list[Conflict]:
-    pairs = _normalize_pairs(incompatible_actions or DEFAULT_INCOMPATIBLE_ACTIONS)
-    conflicts: list[Conflict] = []
-
-    if HAVE_Z3:
-        compiler = SymbolicCompiler()
-        for atom_a, atom_b in combinations(atoms, 2):
-            req_a = compiler.requirement_expr(atom_a)
-            req_b = compiler.requirement_expr(atom_b)
-            if req_a is None or req_b is None:
-                continue
-
-            cond_a = compiler.condition_expr(atom_a)
-            cond_b = compiler.condition_expr(atom_b)
-
-            overlap_solver = Solver()
-            _add_incompatible_action_constraints(overlap_solver, compiler, pairs)
-            overlap_solver.add(cond_a)
-            overlap_solver.add(cond_b)
-            if overlap_solver.check() != sat:
-                continue
-
-            conflict_solver = Solver()
-            _add_incompatible_action_constraints(conflict_solver, compiler, pairs)
-            conflict_solver.add(cond_a)
-            conflict_solver.add(cond_b)
-            conflict_solver.add(req_a)
-            conflict_solver.add(req_b)
-
-            if conflict_solver.check() != sat:
-                conflicts.append(
-                    Conflict(
-                        rule_a=atom_a.rule_id,
-                        rule_b=atom_b.rule_id,
-                        reason="Mutually exclusive obligations under overlapping triggers",
-                    )
-                )
-        return conflicts
-
-    for atom_a, atom_b in combinations(atoms, 2):
-        requirement_a = _requirement_signature(atom_a)
-        requirement_b = _requirement_signature(atom_b)
-        if requirement_a is None or requirement_b is None:
-            continue
-        if not _condition_overlap(atom_a, atom_b):
-            continue
-        if _requirements_conflict(requirement_a, requirement_b, pairs):
-            conflicts.append(
-                Conflict(
-                    rule_a=atom_a.rule_id,
-                    rule_b=atom_b.rule_id,
-                    reason="Mutually exclusive obligations under overlapping triggers",
-                )
-            )
-
-    return conflicts
+    pairs = _incompatible_pairs(incompatible_actions)
+    signatures = [_requirement_signature(atom) for atom in atoms]
+    _, pos_masks, neg_masks = _encode(atoms)
+
+    # Conditions are conjunctions of predicate literals and requirements are
+    # single action literals on separate variables, so two rules conflict
+    # exactly when their conditions can hold together and their requirements
+    # clash. Both are decided on the masks; a solver could only agree.
+    return [
+        Conflict(
+            rule_a=atoms[index_a].rule_id,
+            rule_b=atoms[index_b].rule_id,
+            reason=_CONFLICT_REASON,
+        )
+        for index_a, index_b in _conflicting_pairs(signatures, pos_masks, neg_masks, pairs)
+    ]
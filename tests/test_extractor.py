@@ -0,0 +1,70 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from neural_lex.extractor import (
+    WORKERS_ENV,
+    _fuse_patterns,
+    detect_conditions,
+    detect_subject,
+    extract_logic_atoms_from_text,
+)
+from neural_lex.models import ConditionLiteral
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "tll_ch2_excerpt.txt"
+
+
+def test_tram_driver_overlaps_generic_driver() -> None:
+    # "kuljettaj" also matches inside the tram phrase; the specific entry wins.
+    assert detect_subject("Raitiovaunun kuljettajan on väistettävä.") == "tram_driver"
+    assert detect_subject("Kuljettajan on väistettävä.") == "driver"
+
+
+def test_negated_yield_sign_overrides_positive_hit() -> None:
+    # "väistämismerkki" matches inside the negated phrase too; the later,
+    # negative table entry must override it.
+    sentence = "Risteyksessä, jossa ei ole väistämismerkkiä, on väistettävä."
+    conditions = detect_conditions(sentence)
+    assert ConditionLiteral("has_yield_sign", False) in conditions
+    assert ConditionLiteral("has_yield_sign", True) not in conditions
+    assert detect_conditions("Väistämismerkki velvoittaa väistämään.") == [
+        ConditionLiteral("has_yield_sign", True)
+    ]
+
+
+def _many_sections() -> str:
+    example = EXAMPLE.read_text(encoding="utf-8")
+    extra = "\n\n".join(
+        f"{number} § Väistämisvelvollisuus\n"
+        "Kuljettajan on väistettävä risteyksessä oikealta tulevaa, "
+        f"jos {number - 1} § ei muuta edellytä. "
+        "Polkupyöräilijä ei saa ohittaa raitiovaunua, kun ei ole väistämismerkkiä."
+        for number in range(40, 52)
+    )
+    return f"{example}\n\n{extra}\n"
+
+
+def test_pooled_extraction_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    text = _many_sections()
+    monkeypatch.delenv(WORKERS_ENV, raising=False)
+    serial = extract_logic_atoms_from_text(text)
+
+    monkeypatch.setenv(WORKERS_ENV, "2")
+    pooled = extract_logic_atoms_from_text(text)
+
+    assert len(serial) > 12
+    assert pooled == serial
+
+
+@pytest.mark.parametrize("value", ["many", "0", "-2"])
+def test_invalid_worker_count_is_rejected(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv(WORKERS_ENV, value)
+    with pytest.raises(ValueError, match=WORKERS_ENV):
+        extract_logic_atoms_from_text(EXAMPLE.read_text(encoding="utf-8"))
+
+
+def test_fused_patterns_must_be_lower_case() -> None:
+    _fuse_patterns([(re.compile(r"\bon\s+\S*tt[äa]v[äa]", flags=re.IGNORECASE), "must")])
+    with pytest.raises(ValueError, match="lower case"):
+        _fuse_patterns([(re.compile(r"\bVäist", flags=re.IGNORECASE), "yield")])
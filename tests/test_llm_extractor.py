@@ -1,4 +1,7 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from neural_lex.llm_extractor import RecursiveLLMExtractor, LLMProvider
 from neural_lex.models import LogicAtom, Section
 
@@ -64,5 +67,117 @@ class TestRecursiveExtractor(unittest.TestCase):
         self.assertEqual(len(extractor.cache["24"]), 1)
         self.assertEqual(extractor.cache["24"][0].rule_id, "TLL_24_1")
 
+class BatchingProvider(MockProvider):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def query(self, prompt: str, system_prompt: str | None = None) -> str:
+        self.prompts.append(prompt)
+        sections = {
+            sec_num: resp["atoms"]
+            for sec_num, resp in self.responses.items()
+            if f"Section {sec_num}:" in prompt
+        }
+        return json.dumps({"sections": sections})
+
+
+class TestBatchedExtraction(unittest.TestCase):
+    TEXT = (
+        "18 § Yielding\nDriver must yield to right. See 24 §.\n\n"
+        "24 § Priority\nDriver may proceed if priority sign.\n"
+    )
+
+    def test_sections_are_batched_into_one_request(self):
+        provider = BatchingProvider()
+        extractor = RecursiveLLMExtractor(provider, batch_size=10)
+
+        atoms = extractor.extract_from_text(self.TEXT)
+
+        self.assertEqual([a.rule_id for a in atoms], ["TLL_18_1", "TLL_24_1"])
+        self.assertEqual(len(provider.prompts), 1)
+
+    def test_disk_cache_skips_provider_on_rerun(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "atoms.json"
+            first = BatchingProvider()
+            RecursiveLLMExtractor(first, cache_path=cache_path).extract_from_text(self.TEXT)
+            self.assertTrue(cache_path.exists())
+
+            second = BatchingProvider()
+            extractor = RecursiveLLMExtractor(second, cache_path=cache_path)
+            atoms = extractor.extract_from_text(self.TEXT)
+
+            self.assertEqual([a.rule_id for a in atoms], ["TLL_18_1", "TLL_24_1"])
+            self.assertEqual(second.prompts, [])
+
+    def test_saving_leaves_only_the_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "atoms.json"
+            extractor = RecursiveLLMExtractor(BatchingProvider(), cache_path=cache_path)
+            extractor.extract_from_text(self.TEXT)
+
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["atoms.json"])
+            self.assertIsInstance(json.loads(cache_path.read_text(encoding="utf-8")), dict)
+
+    def test_provider_without_model_name(self):
+        class PlainProvider:
+            def __init__(self):
+                self.prompts = []
+
+            def query(self, prompt: str, system_prompt: str | None = None) -> str:
+                self.prompts.append(prompt)
+                return json.dumps({"atoms": []})
+
+        provider = PlainProvider()
+        self.assertEqual(RecursiveLLMExtractor(provider).extract_from_text(self.TEXT), [])
+        self.assertTrue(provider.prompts)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "atoms.json"
+            extractor = RecursiveLLMExtractor(PlainProvider(), cache_path=cache_path)
+            self.assertEqual(extractor.extract_from_text(self.TEXT), [])
+            self.assertTrue(cache_path.exists())
+
+    def test_cache_without_object_root_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "atoms.json"
+            cache_path.write_text("[1, 2, 3]", encoding="utf-8")
+            provider = BatchingProvider()
+
+            extractor = RecursiveLLMExtractor(provider, cache_path=cache_path)
+            atoms = extractor.extract_from_text(self.TEXT)
+
+            self.assertEqual([a.rule_id for a in atoms], ["TLL_18_1", "TLL_24_1"])
+            self.assertEqual(len(provider.prompts), 1)
+
+    def test_bad_cache_entry_is_treated_as_a_miss(self):
+        prompts = []
+
+        class CountingProvider(MockProvider):
+            def query(self, prompt: str, system_prompt: str | None = None) -> str:
+                prompts.append(prompt)
+                return super().query(prompt, system_prompt)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "atoms.json"
+            RecursiveLLMExtractor(CountingProvider(), cache_path=cache_path).extract_from_text(
+                self.TEXT
+            )
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            bad_key = next(iter(cached))
+            cached[bad_key] = [{"subject": "x"}]
+            cache_path.write_text(json.dumps(cached), encoding="utf-8")
+            prompts.clear()
+
+            extractor = RecursiveLLMExtractor(CountingProvider(), cache_path=cache_path)
+            atoms = extractor.extract_from_text(self.TEXT)
+
+            self.assertEqual([a.rule_id for a in atoms], ["TLL_18_1", "TLL_24_1"])
+            self.assertEqual(len(prompts), 1)
+            repaired = json.loads(cache_path.read_text(encoding="utf-8"))
+            self.assertNotEqual(repaired[bad_key], [{"subject": "x"}])
+
+
 if __name__ == "__main__":
     unittest.main()
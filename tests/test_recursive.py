@@ -0,0 +1,61 @@
+from neural_lex.models import LogicAtom
+from neural_lex.recursive import resolve_rule_references
+
+
+def _rule(rule_id: str, section: str, references: list[str]) -> LogicAtom:
+    return LogicAtom.from_dict(
+        {
+            "rule_id": rule_id,
+            "action": "yield",
+            "modality": "must",
+            "source_section": section,
+            "references": references,
+        }
+    )
+
+
+def _chain() -> list[LogicAtom]:
+    # 1 -> 2 -> 3 -> 4 -> 5, plus a reference to a section that has no rules.
+    return [
+        _rule("R1", "1", ["2", "99"]),
+        _rule("R2", "2", ["3"]),
+        _rule("R3", "3", ["4"]),
+        _rule("R4", "4", ["5"]),
+        _rule("R5", "5", []),
+    ]
+
+
+def test_depth_zero_follows_no_references() -> None:
+    resolved = resolve_rule_references(_chain(), max_depth=0)
+    assert resolved == {rule_id: set() for rule_id in ("R1", "R2", "R3", "R4", "R5")}
+
+
+def test_depth_one_returns_directly_referenced_rules() -> None:
+    resolved = resolve_rule_references(_chain(), max_depth=1)
+    assert resolved["R1"] == {"R2"}
+    assert resolved["R4"] == {"R5"}
+    assert resolved["R5"] == set()
+
+
+def test_depth_three_follows_three_hops() -> None:
+    resolved = resolve_rule_references(_chain(), max_depth=3)
+    assert resolved["R1"] == {"R2", "R3", "R4"}
+    assert resolved["R2"] == {"R3", "R4", "R5"}
+    assert resolved["R3"] == {"R4", "R5"}
+
+
+def test_reference_cycle_terminates_and_reaches_itself() -> None:
+    atoms = [
+        _rule("A", "1", ["2"]),
+        _rule("B", "2", ["3"]),
+        _rule("C", "3", ["1"]),
+        _rule("D", "3", []),
+    ]
+
+    resolved = resolve_rule_references(atoms, max_depth=2)
+    assert resolved["A"] == {"B", "C", "D"}
+    assert resolved["C"] == {"A", "B"}
+
+    resolved = resolve_rule_references(atoms, max_depth=50)
+    assert resolved["A"] == {"A", "B", "C", "D"}
+    assert resolved["D"] == set()
@@ -1,5 +1,17 @@
+import random
+from itertools import product
+
+import pytest
+
+from neural_lex import symbolic
 from neural_lex.models import LogicAtom
-from neural_lex.symbolic import find_pairwise_conflicts
+from neural_lex.symbolic import check_scenario, find_pairwise_conflicts
+
+
+def test_from_dict_accepts_non_string_subject() -> None:
+    atom = LogicAtom.from_dict({"rule_id": "A", "subject": None, "action": "yield"})
+    assert atom.subject is None
+    assert atom.action == "yield"
 
 
 def test_no_conflict_when_conditions_do_not_overlap() -> None:
@@ -61,3 +73,157 @@ def test_conflict_on_incompatible_mandatory_actions() -> None:
     assert len(conflicts) == 1
     assert conflicts[0].rule_a == "A"
     assert conflicts[0].rule_b == "B"
+
+
+def _atom(rule_id: str, action: str, modality: str, conditions: list[str]) -> LogicAtom:
+    return LogicAtom.from_dict(
+        {"rule_id": rule_id, "action": action, "modality": modality, "conditions": conditions}
+    )
+
+
+@pytest.fixture
+def python_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(symbolic, "HAVE_Z3", False)
+    monkeypatch.setattr(symbolic, "HAVE_PYSAT", False)
+
+
+def test_fallback_scenario_consistent(python_fallback: None) -> None:
+    atoms = [
+        _atom("TLL_18", "yield", "must", ["approaching_intersection", "!has_yield_sign"]),
+        _atom("TLL_24", "yield", "must", ["approaching_intersection", "has_yield_sign"]),
+        _atom("TLL_25", "proceed", "may", ["approaching_intersection"]),
+    ]
+
+    consistent, model = check_scenario(atoms, {"approaching_intersection": True})
+
+    assert consistent
+    assert model is not None
+    assert model["approaching_intersection"] is True
+    assert model["must_yield"] is True
+
+
+def test_fallback_scenario_inconsistent(python_fallback: None) -> None:
+    atoms = [
+        _atom("A", "yield", "must", ["approaching_intersection", "has_yield_sign"]),
+        _atom("B", "proceed", "must", ["approaching_intersection", "has_yield_sign"]),
+    ]
+
+    consistent, model = check_scenario(
+        atoms, {"approaching_intersection": True, "has_yield_sign": True}
+    )
+
+    assert not consistent
+    assert model is None
+
+
+def test_fallback_scenario_negated_condition_needs_predicate_set(python_fallback: None) -> None:
+    # With p false (the all-false assignment) A and B demand opposite things;
+    # only switching p on deactivates A.
+    atoms = [
+        _atom("A", "stop", "must", ["!p"]),
+        _atom("B", "stop", "must_not", []),
+        _atom("C", "proceed", "must", ["p", "q"]),
+        _atom("D", "proceed", "must_not", ["q"]),
+    ]
+
+    consistent, model = check_scenario(atoms, {})
+
+    assert consistent
+    assert model is not None
+    assert model["p"] is True
+    assert model["q"] is False
+    assert model["must_stop"] is False
+
+
+PREDICATES = ["p", "q", "r", "s", "t"]
+ACTIONS = ["yield", "stop", "proceed", "overtake", "turn"]
+
+
+def _random_atoms(rng: random.Random) -> list[LogicAtom]:
+    atoms = []
+    for index in range(rng.randint(0, 8)):
+        conditions = [
+            ("!" if rng.random() < 0.4 else "") + name
+            for name in rng.sample(PREDICATES, rng.randint(0, 3))
+        ]
+        modality = rng.choice(["must", "must_not", "may"])
+        atoms.append(_atom(f"R{index}", rng.choice(ACTIONS), modality, conditions))
+    return atoms
+
+
+def _random_assumptions(rng: random.Random) -> dict[str, bool]:
+    # "u" never appears in a rule, so it is assumed without being constrained.
+    names = rng.sample([*PREDICATES, "u"], rng.randint(0, 3))
+    return {name: rng.random() < 0.5 for name in names}
+
+
+def _consistent_under(atoms: list[LogicAtom], values: dict[str, bool]) -> bool:
+    required: dict[str, bool] = {}
+    for atom in atoms:
+        if atom.modality == "may":
+            continue
+        if all(values.get(literal.name, False) == literal.value for literal in atom.conditions):
+            needed = atom.modality == "must"
+            if required.setdefault(atom.action, needed) != needed:
+                return False
+    return not any(
+        required.get(left) and required.get(right)
+        for left, right in symbolic.DEFAULT_INCOMPATIBLE_ACTIONS
+    )
+
+
+def test_pysat_fallback_agrees_with_python_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    solvers = pytest.importorskip("pysat.solvers")
+    monkeypatch.setattr(symbolic, "HAVE_Z3", False)
+    # symbolic.py only imports Glucose3 when Z3 is missing.
+    monkeypatch.setattr(symbolic, "Glucose3", solvers.Glucose3, raising=False)
+    rng = random.Random(20)
+    for _ in range(500):
+        atoms = _random_atoms(rng)
+        assumptions = _random_assumptions(rng)
+
+        monkeypatch.setattr(symbolic, "HAVE_PYSAT", True)
+        sat_consistent, sat_model = check_scenario(atoms, assumptions)
+        monkeypatch.setattr(symbolic, "HAVE_PYSAT", False)
+        search_consistent, _ = check_scenario(atoms, assumptions)
+
+        assert sat_consistent == search_consistent, (atoms, assumptions)
+        if sat_consistent:
+            assert sat_model is not None
+            assert all(sat_model[name] == value for name, value in assumptions.items())
+            assert _consistent_under(atoms, sat_model)
+
+
+def test_backend_name_follows_available_solvers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(symbolic, "HAVE_Z3", True)
+    assert symbolic.symbolic_backend_name() == "z3"
+    monkeypatch.setattr(symbolic, "HAVE_Z3", False)
+    monkeypatch.setattr(symbolic, "HAVE_PYSAT", True)
+    assert symbolic.symbolic_backend_name() == "pysat"
+    monkeypatch.setattr(symbolic, "HAVE_PYSAT", False)
+    assert symbolic.symbolic_backend_name() == "fallback"
+
+
+def _brute_force_consistent(atoms: list[LogicAtom], assumptions: dict[str, bool]) -> bool:
+    free = sorted(
+        {literal.name for atom in atoms for literal in atom.conditions} - assumptions.keys()
+    )
+    for values in product([False, True], repeat=len(free)):
+        if _consistent_under(atoms, {**assumptions, **dict(zip(free, values))}):
+            return True
+    return False
+
+
+def test_python_search_matches_brute_force(python_fallback: None) -> None:
+    rng = random.Random(22)
+    for _ in range(1500):
+        atoms = _random_atoms(rng)
+        assumptions = _random_assumptions(rng)
+
+        consistent, model = check_scenario(atoms, assumptions)
+
+        assert consistent == _brute_force_consistent(atoms, assumptions), (atoms, assumptions)
+        if consistent:
+            assert model is not None
+            assert all(model[name] == value for name, value in assumptions.items())
+            assert _consistent_under(atoms, model)